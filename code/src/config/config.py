@@ -5,6 +5,7 @@ BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
 OUTPUT_DIR = BASE_DIR / "output"
 MODELS_DIR = BASE_DIR / "models"
+CACHE_DIR = BASE_DIR / ".cache"  # Arrow IPC copies of loaded data, created on first load
 
 # Define data file paths
 DATA_FILES = {
@@ -31,9 +32,20 @@ ANALYSIS_SETTINGS = {
     }
 }
 
+# Data loading settings
+LOADER_SETTINGS = {
+    "transaction_chunk_size": 512_000  # rows per chunk when streaming transaction files
+}
+
 
 # Model paths
 LLM_MODEL_PATH = MODELS_DIR / "mistral-7b-instruct-v0.2.Q4_K_M.gguf"
+TTS_MODEL_PATH = MODELS_DIR / "en_US-amy-low.onnx"  # Piper voice, with its .onnx.json config alongside
+
+# Speech output settings
+TTS_SETTINGS = {
+    "cache_max_bytes": 256 * 1024 * 1024  # synthesized clips kept per voice; least recently used are evicted
+}
 
 
 # Output settings
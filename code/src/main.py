@@ -1,11 +1,11 @@
 import argparse
-import json
 import pandas as pd
 from pathlib import Path
-from src.data_processing.data_loader import FinancialDataLoader
+from src.data_processing.data_loader import FinancialDataLoader, convert_csvs_to_parquet
 from src.data_processing.data_extractor import DataExtractor
 from src.ai.llm_interaction import LLMInteraction
 from src.voice.voice_processor import VoiceProcessor
+from src.utils.json_io import dump_json, write_json, read_json
 
 # ANSI color codes
 BLUE = "\033[94m"
@@ -20,24 +20,22 @@ def save_json(data: dict, filename: str):
     output_dir.mkdir(exist_ok=True)
     
     output_path = output_dir / filename
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(data, output_path)
     print(f"{GREEN}✓ Saved {filename}{END}")
 
+def load_json(filename: str):
+    """Load data from a JSON file in the output directory."""
+    return read_json(Path("output") / filename)
+
 def update_recommendations(new_posts_file: str):
     """Update recommendations based on new social media posts."""
     try:
         # Load existing data
-        with open("output/spending_analysis.json", 'r') as f:
-            spending_data = json.load(f)
-        with open("output/kyc_details.json", 'r') as f:
-            kyc_details = json.load(f)
-        with open("output/user_interests.json", 'r') as f:
-            user_interests = json.load(f)
-        with open("output/product_recommendations.json", 'r') as f:
-            product_recommendations = json.load(f)
-        with open("output/credit_card_recommendations.json", 'r') as f:
-            credit_card_recommendations = json.load(f)
+        spending_data = load_json("spending_analysis.json")
+        kyc_details = load_json("kyc_details.json")
+        user_interests = load_json("user_interests.json")
+        product_recommendations = load_json("product_recommendations.json")
+        credit_card_recommendations = load_json("credit_card_recommendations.json")
 
         # Load new posts
         data_loader = FinancialDataLoader()
@@ -81,10 +79,10 @@ def update_recommendations(new_posts_file: str):
 
         print(f"\n{GREEN}=== Updated Recommendations ==={END}")
         print("\nUpdated Product Recommendations:")
-        print(json.dumps(new_product_recommendations, indent=2))
+        print(dump_json(new_product_recommendations).decode())
         
         print("\nUpdated Credit Card Recommendations:")
-        print(json.dumps(new_credit_card_recommendations, indent=2))
+        print(dump_json(new_credit_card_recommendations).decode())
 
     except Exception as e:
         print(f"{RED}Error updating recommendations: {str(e)}{END}")
@@ -104,8 +102,14 @@ def main():
     parser = argparse.ArgumentParser(description='Personalized Banking Services')
     parser.add_argument('--update-social', type=str, help='Update recommendations with new social media posts file')
     parser.add_argument('--voice', type=str, help='Process a specific audio file (WAV, MP3, or M4A format)')
+    parser.add_argument('--convert-parquet', action='store_true', help='Write Parquet copies of the CSV data files for faster loading')
     args = parser.parse_args()
 
+    if args.convert_parquet:
+        converted = convert_csvs_to_parquet()
+        print(f"{GREEN}✓ Converted {len(converted)} data files to Parquet{END}")
+        return
+
     if args.voice:
         voice_interaction(args.voice)
         return
@@ -155,10 +159,10 @@ def main():
     # Print final output
     print(f"\n{GREEN}=== Final Recommendations ==={END}")
     print("\nProduct Recommendations:")
-    print(json.dumps(product_recommendations, indent=2))
+    print(dump_json(product_recommendations).decode())
     
     print("\nCredit Card Recommendations:")
-    print(json.dumps(credit_card_recommendations, indent=2))
+    print(dump_json(credit_card_recommendations).decode())
 
 if __name__ == "__main__":
     main()
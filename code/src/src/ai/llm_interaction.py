@@ -1,4 +1,4 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 from pathlib import Path
 from llama_cpp import Llama
 import json
@@ -28,6 +28,14 @@ class LLMInteraction:
             logger.error(f"Error initializing Mistral model: {str(e)}")
             raise
         
+    def warmup(self) -> None:
+        """Generate a single token so the first real request skips model setup costs."""
+        logger.debug("Warming up Mistral model")
+        try:
+            self.llm.create_completion("Hello", max_tokens=1)
+        except Exception as e:
+            logger.warning(f"Mistral warmup failed: {str(e)}")
+        
     def _generate_response(self, prompt: str, max_tokens: int = 2048) -> str:
         """Generate response using Mistral model."""
         logger.debug(f"Generating response with max_tokens={max_tokens}")
@@ -120,10 +128,10 @@ User Interests:
 
 Available Wells Fargo Products:
 Credit Cards:
-{pd.read_csv('data/Wells_Fargo_Credit_Card_Details.csv').to_json(orient='records', indent=2)}
+{pd.read_csv('data/Wells_Fargo_Credit_Card_Details.csv', engine='pyarrow').to_json(orient='records', indent=2)}
 
 Loans:
-{pd.read_csv('data/Wells_Fargo_Loan_Details.csv').to_json(orient='records', indent=2)}
+{pd.read_csv('data/Wells_Fargo_Loan_Details.csv', engine='pyarrow').to_json(orient='records', indent=2)}
 
 Please provide recommendations in the following JSON format:
 {{
@@ -233,7 +241,7 @@ User Interests:
 {', '.join(user_interests)}
 
 Available Wells Fargo Credit Cards:
-{pd.read_csv('data/Wells_Fargo_Credit_Card_Details.csv').to_json(orient='records', indent=2)}
+{pd.read_csv('data/Wells_Fargo_Credit_Card_Details.csv', engine='pyarrow').to_json(orient='records', indent=2)}
 
 Please provide recommendations in the following JSON format:
 {{
@@ -326,24 +334,31 @@ Please provide analysis in the following JSON format:
                 "recommendations": []
             }
 
-    def generate_response(self, query: str, data: dict) -> str:
-        """Generate a response based on the query and available data."""
-        logger.info(f"Generating response for query: {query[:100]}...")
-        try:
-            # Extract relevant data
-            spending_data = data.get('spending_analysis', {})
-            kyc_details = data.get('kyc_details', {})
-            credit_cards = data.get('credit_card_recommendations', {}).get('recommendations', [])
-            
-            # Get top spending categories
-            top_categories = dict(sorted(
-                spending_data.get('spending_by_category', {}).items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:3])
-            
-            # Construct prompt for the LLM
-            prompt = f"""Based on the user's query and profile, recommend our best products with a persuasive tone:
+    # Sampling settings for conversational responses
+    RESPONSE_SAMPLING = {
+        "max_tokens": 512,
+        "temperature": 0.7,
+        "top_p": 0.95,
+        "repeat_penalty": 1.1,
+        "top_k": 40
+    }
+
+    def _build_response_prompt(self, query: str, data: dict) -> str:
+        """Build the prompt for answering a user query from their analysis data."""
+        # Extract relevant data
+        spending_data = data.get('spending_analysis', {})
+        kyc_details = data.get('kyc_details', {})
+        credit_cards = data.get('credit_card_recommendations', {}).get('recommendations', [])
+        
+        # Get top spending categories
+        top_categories = dict(sorted(
+            spending_data.get('spending_by_category', {}).items(),
+            key=lambda x: x[1],
+            reverse=True
+        )[:3])
+        
+        # Construct prompt for the LLM
+        return f"""Based on the user's query and profile, recommend our best products with a persuasive tone:
 
 Query: {query}
 
@@ -361,33 +376,73 @@ Focus on:
 2. Highlight relevant benefits and rewards
 3. Include credit limits and rates
 4. Be persuasive but professional"""
+
+    def generate_response(self, query: str, data: dict) -> str:
+        """Generate a response based on the query and available data."""
+        logger.info("Generating response for query: %.100s...", query)
+        try:
+            prompt = self._build_response_prompt(query, data)
             
             # Generate response using LLM
             logger.debug("Generating response using LLM")
-            response = self.llm.create_completion(
-                prompt,
-                max_tokens=512,
-                temperature=0.7,
-                top_p=0.95,
-                repeat_penalty=1.1,
-                top_k=40
-            )
+            response = self.llm.create_completion(prompt, **self.RESPONSE_SAMPLING)
             
             # Extract and clean up the response
-            text = response["choices"][0]["text"].strip()
-            
-            # Try to parse JSON response if present
-            if text.startswith('{') and text.endswith('}'):
-                try:
-                    response_data = json.loads(text)
-                    text = response_data.get('response', text)
-                    logger.debug("Successfully parsed JSON response")
-                except Exception as e:
-                    logger.warning(f"Error parsing JSON response: {str(e)}")
+            text = self._unwrap_response(response["choices"][0]["text"].strip())
             
             logger.info("Successfully generated response")
             return text
             
         except Exception as e:
             logger.error(f"Error generating response: {str(e)}")
-            return "" 
\ No newline at end of file
+            return ""
+
+    @staticmethod
+    def _unwrap_response(text: str) -> str:
+        """Return the 'response' field of a JSON-wrapped response, or the text unchanged."""
+        # Try to parse JSON response if present
+        if text.startswith('{') and text.endswith('}'):
+            try:
+                response_data = json.loads(text)
+                text = response_data.get('response', text)
+                logger.debug("Successfully parsed JSON response")
+            except Exception as e:
+                logger.warning(f"Error parsing JSON response: {str(e)}")
+        return text
+
+    def generate_response_stream(self, query: str, data: dict) -> Iterator[str]:
+        """Generate a response like generate_response, yielding text as the model produces it.
+        
+        A response that starts as a JSON object is buffered and unwrapped as in
+        generate_response, then yielded whole.
+        
+        Raises:
+            Exception: Any error from the model, after it has been logged, so callers
+                can tell a failed response from an empty one
+        """
+        logger.info("Streaming response for query: %.100s...", query)
+        try:
+            prompt = self._build_response_prompt(query, data)
+            # Text is held back until its first non-blank character shows whether it is JSON
+            buffer = ""
+            is_json = None
+            for chunk in self.llm.create_completion(prompt, stream=True, **self.RESPONSE_SAMPLING):
+                text = chunk["choices"][0]["text"]
+                if not text:
+                    continue
+                if is_json is False:
+                    yield text
+                    continue
+                buffer += text
+                if is_json is None and buffer.strip():
+                    is_json = buffer.lstrip().startswith('{')
+                    if not is_json:
+                        yield buffer
+                        buffer = ""
+            if buffer.strip():
+                yield self._unwrap_response(buffer.strip())
+            logger.info("Successfully streamed response")
+            
+        except Exception as e:
+            logger.error(f"Error streaming response: {str(e)}")
+            raise
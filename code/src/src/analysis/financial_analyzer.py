@@ -41,8 +41,11 @@ class FinancialAnalyzer:
             # Calculate total spending by category
             category_spending = self.transactions.groupby('Category')['Amount ($)'].sum().sort_values(ascending=False)
             
-            # Calculate monthly spending trends
-            monthly_spending = self.transactions.groupby(self.transactions['Date'].dt.to_period('M'))['Amount ($)'].sum()
+            # Calculate monthly spending trends, bucketing on datetime64[M]
+            # and only converting the per-month result to periods
+            month = self.transactions['Date'].to_numpy().astype('datetime64[M]')
+            monthly_spending = self.transactions.groupby(month)['Amount ($)'].sum()
+            monthly_spending.index = monthly_spending.index.to_period('M')
             
             # Calculate average transaction amount by category
             avg_transaction = self.transactions.groupby('Category')['Amount ($)'].mean()
@@ -152,11 +155,11 @@ class FinancialAnalyzer:
 
     def calculate_credit_score_factors(self) -> Dict[str, float]:
         """Calculate factors that might influence credit score."""
-        df = self.transactions.copy()
+        df = self.transactions
         
         # Calculate payment consistency
-        df['month'] = df['Date'].dt.to_period('M')
-        monthly_payments = df.groupby('month')['Amount ($)'].sum()
+        month = df['Date'].to_numpy().astype('datetime64[M]')
+        monthly_payments = df.groupby(month)['Amount ($)'].sum()
         payment_consistency = monthly_payments.std() / monthly_payments.mean()
         
         # Calculate spending diversity
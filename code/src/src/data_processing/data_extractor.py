@@ -4,23 +4,42 @@ from typing import Dict, Any, List
 from pathlib import Path
 from datetime import datetime, timedelta
 import logging
+import re
 from src.utils.logger import setup_logger
-
-# ANSI color codes
-BLUE = "\033[94m"
-GREEN = "\033[92m"
-YELLOW = "\033[93m"
-RED = "\033[91m"
-END = "\033[0m"
+from src.utils.dates import parse_dates
 
 # Set up logging
 logger = setup_logger(__name__)
 
+# Merchant keywords per transaction category, checked in order
+TRANSACTION_CATEGORIES = {
+    'dining': ['restaurant', 'starbucks'],
+    'shopping': ['amazon', 'walmart', 'costco', 'best buy', 'nike', 'apple'],
+    'entertainment': ['netflix', 'spotify'],
+    'travel': ['airline', 'hotel', 'airbnb', 'uber'],
+    'transportation': ['tesla', 'supercharger'],
+    'fitness': ['gym'],
+    'insurance': ['insurance'],
+    'investments': ['equity', 'mutual funds'],
+    'electronics': ['electronic', 'gadgets'],
+    'uncategorized': []
+}
+
+# Single compiled matcher for all categories: each alternative looks ahead for
+# any of its keywords and captures an empty named group, so `lastgroup` is the
+# first category (in table order) whose keywords occur in the merchant name.
+_CATEGORY_PATTERN = re.compile(
+    '(?:' + '|'.join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{category}>)"
+        for category, keywords in TRANSACTION_CATEGORIES.items() if keywords
+    ) + ')',
+    re.IGNORECASE | re.DOTALL
+)
+
 class DataExtractor:
     def __init__(self, data_dict):
         """Initialize the DataExtractor with loaded data."""
         logger.info("Initializing DataExtractor")
-        print(f"{BLUE}Initializing DataExtractor...{END}")
         self.transactions = data_dict.get('transactions', pd.DataFrame())
         self.credit_card_transactions = data_dict.get('credit_card_transactions', pd.DataFrame())
         self.social_media = data_dict.get('social_media', pd.DataFrame())
@@ -37,7 +56,8 @@ class DataExtractor:
             amount_column = 'Amount (USD)' if 'Amount (USD)' in self.transactions.columns else 'Amount ($)'
             self.transactions[amount_column] = pd.to_numeric(self.transactions[amount_column], errors='coerce')
             if 'Transaction Type' in self.transactions.columns:
-                self.transactions.loc[self.transactions['Transaction Type'].str.lower().str.contains('debit', na=False), amount_column] *= -1
+                debit_mask = self.transactions['Transaction Type'].str.lower().str.contains('debit', na=False)
+                self.transactions[amount_column] = self.transactions[amount_column].mask(debit_mask, -self.transactions[amount_column])
             
             # Merge with categories if Category column doesn't exist
             if 'Category' not in self.transactions.columns and not self.receiver_categories.empty:
@@ -54,11 +74,15 @@ class DataExtractor:
             amount_column = 'Amount (USD)' if 'Amount (USD)' in self.credit_card_transactions.columns else 'Amount ($)'
             self.credit_card_transactions[amount_column] = pd.to_numeric(self.credit_card_transactions[amount_column], errors='coerce')
             if 'Transaction Type' in self.credit_card_transactions.columns:
-                self.credit_card_transactions.loc[self.credit_card_transactions['Transaction Type'].str.lower().str.contains('debit', na=False), amount_column] *= -1
+                debit_mask = self.credit_card_transactions['Transaction Type'].str.lower().str.contains('debit', na=False)
+                self.credit_card_transactions[amount_column] = self.credit_card_transactions[amount_column].mask(debit_mask, -self.credit_card_transactions[amount_column])
             
             # Fill any missing categories with 'Other'
             if 'Category' in self.credit_card_transactions.columns:
-                self.credit_card_transactions['Category'] = self.credit_card_transactions['Category'].fillna('Other')
+                categories = self.credit_card_transactions['Category']
+                if isinstance(categories.dtype, pd.CategoricalDtype) and 'Other' not in categories.cat.categories:
+                    categories = categories.cat.add_categories(['Other'])
+                self.credit_card_transactions['Category'] = categories.fillna('Other')
             # Merge with categories if Category column doesn't exist
             elif not self.receiver_categories.empty:
                 # Rename Merchant to Receiver for merging
@@ -78,13 +102,10 @@ class DataExtractor:
         """Get a summary of user's spending patterns."""
         logger.info("Generating spending summary")
         try:
-            print(f"{BLUE}Generating spending summary...{END}")
             spending_data = self._generate_spending_summary()
-            print(f"{GREEN}Spending summary generated successfully!{END}")
             logger.info("Successfully generated spending summary")
             return spending_data
         except Exception as e:
-            print(f"{RED}Error generating spending summary: {str(e)}{END}")
             logger.error(f"Error generating spending summary: {str(e)}")
             return {
                 'total_spend': 0.0,
@@ -154,13 +175,29 @@ class DataExtractor:
         
         if all_transactions:
             combined_txns = pd.concat(all_transactions, ignore_index=True)
-            combined_txns['Date'] = pd.to_datetime(combined_txns['Date'])
+            combined_txns['Date'] = parse_dates(combined_txns['Date'])
+            
+            # Encode category, month and merchant keys as integer codes
+            cat_codes, categories = pd.factorize(combined_txns['category'], sort=True)
+            month_codes, months = pd.factorize(combined_txns['Date'].to_numpy().astype('datetime64[M]'), sort=True)
+            merchant_column = 'Merchant' if 'Merchant' in combined_txns.columns else 'Receiver'
+            merchant_codes, merchants = pd.factorize(combined_txns[merchant_column], sort=True)
+            
+            # Sum amounts per category, month and merchant with one bincount per key;
+            # missing amounts count as zero and missing (-1) codes are skipped
+            amounts = np.nan_to_num(combined_txns['amount'].to_numpy(dtype=np.float64))
+            def grouped_sum(codes: np.ndarray, n_groups: int) -> np.ndarray:
+                valid = codes >= 0
+                return np.bincount(codes[valid], weights=amounts[valid], minlength=n_groups)
+            category_sums = grouped_sum(cat_codes, len(categories))
+            month_sums = grouped_sum(month_codes, len(months))
+            merchant_sums = grouped_sum(merchant_codes, len(merchants))
             
             # Calculate spending by category
-            spending_by_category = combined_txns.groupby('category')['amount'].sum().to_dict()
+            spending_by_category = dict(zip(categories.tolist(), category_sums.tolist()))
             
             # Calculate monthly spending
-            monthly_spending = combined_txns.groupby(combined_txns['Date'].dt.strftime('%Y-%m'))['amount'].sum().to_dict()
+            monthly_spending = dict(zip(np.datetime_as_string(np.asarray(months), unit='M').tolist(), month_sums.tolist()))
             
             # Calculate current month and last month spending
             current_month = datetime.now().strftime('%Y-%m')
@@ -182,7 +219,7 @@ class DataExtractor:
             avg_transaction = combined_txns['amount'].mean()
             
             # Get top merchants by spend
-            top_merchants = combined_txns.groupby('Merchant' if 'Merchant' in combined_txns.columns else 'Receiver')['amount'].sum().nlargest(5).to_dict()
+            top_merchants = pd.Series(merchant_sums, index=merchants).nlargest(5).to_dict()
             
             spending_data = {
                 'total_spend': total_spend,
@@ -219,9 +256,8 @@ class DataExtractor:
         """Extract KYC details and add demographic insights."""
         logger.info("Extracting KYC details")
         try:
-            print(f"{BLUE}Extracting KYC details...{END}")
             if isinstance(self.kyc, pd.DataFrame) and self.kyc.empty:
-                print(f"{YELLOW}No KYC details available{END}")
+                logger.warning("No KYC details available")
                 return {}
             
             # Handle both DataFrame and dict formats
@@ -240,11 +276,9 @@ class DataExtractor:
                 'typical_spending_patterns': self._get_typical_spending_patterns(age, location)
             }
             
-            print(f"{GREEN}KYC details extracted successfully!{END}")
             logger.debug("Successfully extracted KYC details")
             return {**kyc_data, **demographic_insights}
         except Exception as e:
-            print(f"{RED}Error extracting KYC details: {str(e)}{END}")
             logger.error(f"Error extracting KYC details: {str(e)}")
             return {}
     
@@ -383,7 +417,6 @@ class DataExtractor:
         """Get available financial products."""
         logger.info("Getting available products")
         try:
-            print(f"{BLUE}Getting available products...{END}")
             
             products = {
                 'credit_cards': [],
@@ -409,7 +442,6 @@ class DataExtractor:
         """Extract user interests from social media data."""
         logger.info("Extracting user interests")
         try:
-            print(f"{BLUE}Analyzing user interests...{END}")
             
             if not isinstance(self.social_media, pd.DataFrame) or self.social_media.empty:
                 logger.warning("No social media data available")
@@ -438,8 +470,13 @@ class DataExtractor:
                     if isinstance(content, str):
                         content_lower = content.lower()
                         for category, keywords in interest_keywords.items():
+                            if category in interests:
+                                continue
                             if any(keyword in content_lower for keyword in keywords):
                                 interests.add(category)
+                    # Stop scanning once every category has been found
+                    if len(interests) == len(interest_keywords):
+                        break
             
             # Convert set to list and sort
             interests_list = sorted(list(interests))
@@ -452,8 +489,8 @@ class DataExtractor:
         
     def get_credit_profile(self):
         """Extract credit-related information."""
+        logger.info("Extracting credit profile")
         try:
-            print(f"{BLUE}Extracting credit profile...{END}")
             credit_profile = {
                 'total_credit_limit': 0,
                 'current_balance': 0,
@@ -474,35 +511,17 @@ class DataExtractor:
             # Calculate average monthly spend from credit card transactions
             if not self.credit_card_transactions.empty:
                 monthly_spend = self.credit_card_transactions.groupby(
-                    pd.to_datetime(self.credit_card_transactions['Date']).dt.to_period('M')
+                    parse_dates(self.credit_card_transactions['Date']).to_numpy().astype('datetime64[M]')
                 )['Amount ($)'].sum().abs()
                 credit_profile['avg_monthly_spend'] = monthly_spend.mean()
             
-            print(f"{GREEN}Credit profile extracted successfully!{END}")
+            logger.debug("Successfully extracted credit profile")
             return credit_profile
         except Exception as e:
-            print(f"{RED}Error extracting credit profile: {str(e)}{END}")
+            logger.error(f"Error extracting credit profile: {str(e)}")
             return {}
 
     def _categorize_transaction(self, merchant: str) -> str:
         """Categorize a transaction based on the merchant name."""
-        merchant = merchant.lower()
-        
-        categories = {
-            'dining': ['restaurant', 'starbucks'],
-            'shopping': ['amazon', 'walmart', 'costco', 'best buy', 'nike', 'apple'],
-            'entertainment': ['netflix', 'spotify'],
-            'travel': ['airline', 'hotel', 'airbnb', 'uber'],
-            'transportation': ['tesla', 'supercharger'],
-            'fitness': ['gym'],
-            'insurance': ['insurance'],
-            'investments': ['equity', 'mutual funds'],
-            'electronics': ['electronic', 'gadgets'],
-            'uncategorized': []
-        }
-        
-        for category, keywords in categories.items():
-            if any(keyword in merchant for keyword in keywords):
-                return category
-        
-        return 'uncategorized' 
\ No newline at end of file
+        match = _CATEGORY_PATTERN.match(merchant)
+        return match.lastgroup if match else 'uncategorized'
@@ -1,21 +1,376 @@
 import pandas as pd
+import numpy as np
 from pathlib import Path
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, Callable
 import json
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from src.utils.logger import setup_logger
-from config.config import DATA_FILES
-
-# ANSI color codes
-BLUE = "\033[94m"
-GREEN = "\033[92m"
-YELLOW = "\033[93m"
-RED = "\033[91m"
-END = "\033[0m"
+from src.utils.dates import parse_dates
+from config.config import DATA_FILES, CACHE_DIR, LOADER_SETTINGS
 
 # Set up logging
 logger = setup_logger(__name__)
 
+# Rows per chunk when streaming transaction files with Parquet or pandas
+TRANSACTION_CHUNK_SIZE = LOADER_SETTINGS["transaction_chunk_size"]
+
+# Bytes per block for the multithreaded Arrow CSV reader
+CSV_BLOCK_SIZE = 8 << 20
+
+# Column types declared at read time, per file shape
+TRANSACTION_SCHEMA = {
+    'Amount (USD)': pa.float64(), 'Amount ($)': pa.float64(), 'Date': pa.timestamp('ns'),
+    # Dictionary-encoded while parsing, so the debit mask only inspects the distinct types
+    'Transaction Type': pa.dictionary(pa.int32(), pa.string())
+}
+# Whole-dollar columns are int64, as pandas infers them; like pandas, they come out as
+# floats when a value is missing, or fractional (which falls back to pandas)
+CREDIT_CARD_SCHEMA = {'Annual Fee (USD)': pa.int64(), 'Interest Rate (%)': pa.float64()}
+LOAN_SCHEMA = {'Interest Rate (%)': pa.float64(), 'Loan Amount (USD)': pa.int64(), 'Monthly EMI (USD)': pa.int64()}
+KYC_SCHEMA = {'Age': pa.float64(), 'Income': pa.float64(), 'Credit Score': pa.float64()}
+CREDIT_CARD_LIST_SCHEMA = {
+    'Credit Limit (USD)': pa.int64(), 'Current Balance (USD)': pa.int64(),
+    'Issued Date': pa.timestamp('ns'), 'Expiry Date': pa.timestamp('ns')
+}
+
+# Declared column types per DATA_FILES key, shared by the loaders and the Parquet conversion
+DATA_FILE_SCHEMAS = {
+    "transactions": TRANSACTION_SCHEMA,
+    "credit_card_transactions": TRANSACTION_SCHEMA,
+    "kyc": KYC_SCHEMA,
+    "available_credit_cards": CREDIT_CARD_SCHEMA,
+    "available_loans": LOAN_SCHEMA,
+    "credit_card_list": CREDIT_CARD_LIST_SCHEMA
+}
+
+# Strings read as missing values, the same set as the pandas.read_csv defaults
+CSV_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# Repetitive transaction columns kept as pandas categoricals
+CATEGORICAL_COLUMNS = ('Category', 'Transaction Type', 'Receiver', 'Merchant', 'Card ID')
+
+def _parquet_path(file_path: Path) -> Optional[Path]:
+    """Return the Parquet copy of a CSV file if it exists and is not stale."""
+    parquet_path = Path(file_path).with_suffix('.parquet')
+    try:
+        parquet_mtime = parquet_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    try:
+        if parquet_mtime < Path(file_path).stat().st_mtime_ns:
+            logger.warning(f"Ignoring stale Parquet copy: {parquet_path}")
+            return None
+    except FileNotFoundError:
+        pass
+    return parquet_path
+
+def _csv_options(column_types: Dict[str, pa.DataType]) -> Dict[str, Any]:
+    """Build Arrow CSV reader options for the given column types."""
+    return {
+        'read_options': pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+        'convert_options': pacsv.ConvertOptions(
+            column_types=column_types,
+            null_values=CSV_NULL_VALUES,
+            strings_can_be_null=True
+        )
+    }
+
+def _undeclared_dates(schema: pa.Schema, column_types: Dict[str, pa.DataType]) -> Dict[str, pa.DataType]:
+    """Return string types for date-like columns Arrow inferred on its own.
+    
+    pandas leaves such columns as text, and downstream code serializes
+    them to JSON, so only declared columns are parsed as dates.
+    """
+    return {
+        field.name: pa.string() for field in schema
+        if field.name not in column_types
+        and (pa.types.is_date(field.type) or pa.types.is_timestamp(field.type))
+    }
+
+def _csv_column_types(file_path: Path, schema: Optional[Dict[str, pa.DataType]] = None) -> Dict[str, pa.DataType]:
+    """Return the declared column types plus string types for undeclared date columns.
+    
+    Types are inferred from the first block only, so the file is not parsed in full.
+    """
+    column_types = dict(schema or {})
+    with pacsv.open_csv(file_path, **_csv_options(column_types)) as reader:
+        column_types.update(_undeclared_dates(reader.schema, column_types))
+    return column_types
+
+def _read_csv(file_path: Path, schema: Optional[Dict[str, pa.DataType]] = None) -> pa.Table:
+    """Parse a CSV file with the multithreaded Arrow reader using declared column types."""
+    return pacsv.read_csv(file_path, **_csv_options(_csv_column_types(file_path, schema)))
+
+def _open_table(file_path: Path, schema: Optional[Dict[str, pa.DataType]] = None) -> pa.Table:
+    """Open a tabular data file as an Arrow table, preferring its Parquet copy over the CSV.
+    
+    Raises:
+        pa.ArrowInvalid: If CSV values do not match the declared types
+    """
+    parquet_path = _parquet_path(Path(file_path))
+    if parquet_path is not None:
+        # Map the file so numeric columns are paged in rather than copied
+        return pq.read_table(parquet_path, memory_map=True)
+    return _read_csv(file_path, schema)
+
+def _read_table(file_path: Path, schema: Optional[Dict[str, pa.DataType]] = None) -> pd.DataFrame:
+    """Read a tabular data file into a DataFrame.
+    
+    Args:
+        file_path: Path to the CSV file
+        schema: Declared column types; numeric cells that cannot be converted become NaN
+    """
+    try:
+        df = _open_table(file_path, schema).to_pandas(split_blocks=True, self_destruct=True)
+    except pa.ArrowInvalid:
+        # Dirty numeric cells: read untyped and coerce below
+        logger.warning(f"Values in {file_path} do not match the declared types, coercing to NaN")
+        df = pd.read_csv(file_path)
+    return _coerce_declared(df, schema)
+
+def _read_records(file_path: Path) -> List[Dict[str, Any]]:
+    """Read a tabular data file straight into a list of row dicts.
+    
+    Rows come from the Arrow table directly, so no intermediate DataFrame is built;
+    missing cells are returned as None.
+    """
+    try:
+        table = _open_table(file_path)
+    except pa.ArrowInvalid:
+        logger.warning(f"Could not parse {file_path} with Arrow, falling back to pandas")
+        return pd.read_csv(file_path).to_dict('records')
+    return table.to_pylist()
+
+def _coerce_declared(df: pd.DataFrame, schema: Optional[Dict[str, pa.DataType]]) -> pd.DataFrame:
+    """Convert declared numeric and timestamp columns that were read with another type."""
+    for col, col_type in (schema or {}).items():
+        if col not in df.columns:
+            continue
+        if pa.types.is_floating(col_type) and df[col].dtype != col_type.to_pandas_dtype():
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(col_type.to_pandas_dtype())
+        elif pa.types.is_integer(col_type) and not pd.api.types.is_numeric_dtype(df[col]):
+            # Stays integer when every value converts, float with NaN otherwise
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+        elif pa.types.is_timestamp(col_type) and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = parse_dates(df[col])
+    return df
+
+def _debit_mask(transaction_types: pd.Series):
+    """Return a boolean array marking transaction types that contain 'debit'."""
+    if isinstance(transaction_types.dtype, pd.CategoricalDtype):
+        # Match each category once and gather by code; missing (-1) picks the trailing False
+        category_mask = _debit_mask(pd.Series(transaction_types.cat.categories))
+        return np.append(category_mask, False)[transaction_types.cat.codes.to_numpy()]
+    types = pa.array(transaction_types, type=pa.string(), from_pandas=True)
+    matches = pc.match_substring(types, 'debit', ignore_case=True)
+    return pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
+
+def _iter_table_chunks(file_path: Path, schema: Optional[Dict[str, pa.DataType]] = None) -> Iterator[pd.DataFrame]:
+    """Read a tabular data file in chunks, preferring its Parquet copy over the CSV."""
+    parquet_path = _parquet_path(Path(file_path))
+    if parquet_path is not None:
+        batches = pq.ParquetFile(parquet_path, memory_map=True).iter_batches(batch_size=TRANSACTION_CHUNK_SIZE)
+    else:
+        batches = pacsv.open_csv(file_path, **_csv_options(_csv_column_types(file_path, schema)))
+    for batch in batches:
+        yield batch.to_pandas(split_blocks=True)
+
+# Version of the frames written to the Arrow cache; bump it whenever a loader
+# or declared schema changes what it returns, so older cache files are replaced
+CACHE_VERSION = 3
+
+# Tables behind _cached_load, keyed by cache file path and shared by every
+# loader instance in the process
+_TABLE_CACHE: Dict[Path, pa.Table] = {}
+# Guards _TABLE_CACHE and the cache files, since load_all_data runs loaders on several threads
+_TABLE_CACHE_LOCK = threading.Lock()
+
+def _load_table(cache_path: Path) -> pa.Table:
+    """Return the table for a cache file, memory-mapping it on first use.
+    
+    Cache file names change with the source file and CACHE_VERSION, so a cached table is never stale.
+    """
+    with _TABLE_CACHE_LOCK:
+        table = _TABLE_CACHE.get(cache_path)
+        if table is None:
+            with pa.memory_map(str(cache_path), 'r') as source:
+                table = pa.ipc.open_file(source).read_all()
+            _TABLE_CACHE[cache_path] = table
+        return table
+
+@functools.lru_cache(maxsize=None)
+def _purge_old_cache_versions() -> None:
+    """Delete cache files written under another CACHE_VERSION, once per process."""
+    with _TABLE_CACHE_LOCK:
+        try:
+            for cache_path in CACHE_DIR.glob("*.arrow"):
+                if f"_v{CACHE_VERSION}_" not in cache_path.name:
+                    cache_path.unlink(missing_ok=True)
+                    logger.debug(f"Removed outdated cache file: {cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not clean up the cache directory: {str(e)}")
+
+def _clear_table_cache() -> None:
+    """Drop every cached table, in memory and on disk, so the next loads parse the source files."""
+    with _TABLE_CACHE_LOCK:
+        _TABLE_CACHE.clear()
+        for cache_path in CACHE_DIR.glob("*.arrow"):
+            try:
+                cache_path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not remove cache file {cache_path}: {str(e)}")
+
+def _cached_load(name: str, file_path: Path, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    """Return a loaded DataFrame, cached as an Arrow table keyed by CACHE_VERSION and the source file's mtime and size.
+    
+    Tables are kept in memory for the rest of the process and written to an
+    Arrow IPC file in CACHE_DIR for later runs. Every call returns a new
+    DataFrame, but its numeric columns are read-only views of the cached
+    table: callers may add or replace columns, and must copy the frame
+    before modifying values in place.
+    """
+    try:
+        stat = Path(file_path).stat()
+    except FileNotFoundError:
+        return loader()
+    _purge_old_cache_versions()
+    cache_path = CACHE_DIR / f"{name}_v{CACHE_VERSION}_{stat.st_mtime_ns}_{stat.st_size}.arrow"
+    try:
+        table = _load_table(cache_path)
+        logger.debug(f"Loaded {name} from cache: {cache_path}")
+        # One block per column: no consolidation copy, and numeric columns
+        # can stay views of the mapped file
+        return table.to_pandas(split_blocks=True)
+    except FileNotFoundError:
+        pass
+    
+    df = loader()
+    if df.empty:
+        return df
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except pa.ArrowException as e:
+        logger.warning(f"Could not cache {name}: {str(e)}")
+        return df
+    
+    with _TABLE_CACHE_LOCK:
+        # Drop replaced versions of this file, including ones from older cache versions, before keeping the new one
+        for stale_path in [path for path in _TABLE_CACHE if path.name.startswith(f"{name}_")]:
+            del _TABLE_CACHE[stale_path]
+        _TABLE_CACHE[cache_path] = table
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            for stale_path in CACHE_DIR.glob(f"{name}_*.arrow"):
+                stale_path.unlink()
+            with pa.OSFile(str(cache_path), 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Could not cache {name}: {str(e)}")
+    # The table may share buffers with df, so hand out a view of the table as on a cache hit
+    return table.to_pandas(split_blocks=True)
+
+def _cached_frame(data_file: Optional[str] = None):
+    """Cache a loader method's DataFrame with _cached_load.
+    
+    Args:
+        data_file: DATA_FILES key of the source file; when omitted the
+            method's first argument is used as the file path
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            file_path = Path(args[0]) if data_file is None else DATA_FILES[data_file]
+            name = f"{method.__name__.lstrip('_')}_{file_path.stem}"
+            return _cached_load(name, file_path, lambda: method(self, *args))
+        return wrapper
+    return decorator
+
+def _read_data_file(data_file: str, description: str) -> pd.DataFrame:
+    """Read DATA_FILES[data_file] with its declared column types.
+    
+    Args:
+        data_file: DATA_FILES key of the file to read
+        description: What the file holds, used in error messages
+        
+    Returns:
+        The file's contents, or an empty DataFrame if it cannot be read
+    """
+    try:
+        return _read_table(DATA_FILES[data_file], DATA_FILE_SCHEMAS.get(data_file))
+    except Exception as e:
+        logger.error(f"Error loading {description}: {str(e)}")
+        return pd.DataFrame()
+
+def _prepare_transaction_chunk(df: pd.DataFrame, amount_column: Optional[str],
+                               negate_debits: bool, has_date: bool) -> pd.DataFrame:
+    """Coerce amount and date columns of a chunk of transaction data."""
+    # Convert Amount to numeric, ensuring debits are negative
+    if amount_column is not None:
+        if not pd.api.types.is_numeric_dtype(df[amount_column]):
+            df[amount_column] = pd.to_numeric(df[amount_column], errors='coerce')
+        if negate_debits:
+            # Negate in place on one writable copy: Arrow-backed buffers are read-only
+            amounts = df[amount_column].to_numpy(dtype=np.float64, copy=True)
+            np.negative(amounts, where=_debit_mask(df['Transaction Type']), out=amounts)
+            df[amount_column] = amounts
+    
+    # Convert Date to datetime if it exists
+    if has_date and not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = parse_dates(df['Date'])
+
+    return df
+
+def _transaction_chunk_preparer(columns: pd.Index) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """Specialize _prepare_transaction_chunk for a file's columns."""
+    amount_column = 'Amount (USD)' if 'Amount (USD)' in columns else 'Amount ($)'
+    has_amount = amount_column in columns
+    return functools.partial(
+        _prepare_transaction_chunk,
+        amount_column=amount_column if has_amount else None,
+        negate_debits=has_amount and 'Transaction Type' in columns,
+        has_date='Date' in columns
+    )
+
+def _prepare_transaction_chunks(chunks: Iterator[pd.DataFrame]) -> List[pd.DataFrame]:
+    """Prepare transaction chunks, looking up the column layout on the first chunk only."""
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    if first is None:
+        return []
+    prepare = _transaction_chunk_preparer(first.columns)
+    return [prepare(first)] + [prepare(chunk) for chunk in chunks]
+
+def convert_csvs_to_parquet() -> List[Path]:
+    """Write a zstd-compressed Parquet copy next to every CSV in DATA_FILES."""
+    logger.info("Converting CSV data files to Parquet")
+    converted = []
+    for name, csv_path in DATA_FILES.items():
+        if not csv_path.exists():
+            logger.warning(f"Skipping missing data file: {csv_path}")
+            continue
+        parquet_path = csv_path.with_suffix('.parquet')
+        try:
+            # Declared types are stored in the Parquet file, so dates stay parsed timestamps
+            table = _read_csv(csv_path, DATA_FILE_SCHEMAS.get(name))
+        except pa.ArrowInvalid as e:
+            logger.warning(f"Skipping {name}, values do not match the declared types: {str(e)}")
+            continue
+        pq.write_table(table, parquet_path, compression='zstd')
+        logger.debug(f"Converted {name} to {parquet_path}")
+        converted.append(parquet_path)
+    logger.info(f"Converted {len(converted)} data files to Parquet")
+    return converted
+
 class FinancialDataLoader:
     def __init__(self):
         """Initialize the financial data loader."""
@@ -29,49 +384,82 @@ class FinancialDataLoader:
         self.credit_cards = None
         self.loans = None
         self.credit_card_list = None
+        
+        # Preprocessed transaction frames, valid for _preprocessed_source only
+        self._preprocessed = {}
+        self._preprocessed_source = None
         logger.debug("Data loader initialized")
 
-    def load_all_data(self) -> Dict[str, Any]:
-        """Load all financial data from various sources."""
+    def load_all_data(self, reload: bool = False) -> Dict[str, Any]:
+        """Load all financial data from various sources.
+        
+        Tables are served from the process-wide Arrow cache while their source
+        files are unchanged, so repeated calls only stat the files and build
+        fresh DataFrames from the cached tables.
+        
+        Args:
+            reload: Discard the cached tables, in memory and in CACHE_DIR, and parse
+                the source files again
+        """
+        if reload:
+            _clear_table_cache()
+
         logger.info("Loading all financial data")
         try:
-            # Load social media data as DataFrame
-            social_media_df = pd.read_csv(DATA_FILES["social_media"]) if DATA_FILES["social_media"].exists() else pd.DataFrame()
+            # Independent loaders, run concurrently since file reads and
+            # C-level parsing release the GIL
+            loaders = {
+                'transactions': lambda: self._load_transaction_data(DATA_FILES["transactions"]),
+                'credit_card_transactions': lambda: self._load_transaction_data(DATA_FILES["credit_card_transactions"]),
+                'social_media': self._load_social_media_df,
+                'kyc': self._load_kyc_details,  # Pass KYC details directly
+                'receiver_categories': self._load_receiver_categories,
+                'credit_cards': self._load_credit_cards_df,
+                'loans': self._load_loans,
+                'credit_card_list': self._load_credit_card_list,
+                'emails': self._load_emails
+            }
             
-            # Load KYC details
-            kyc_details = self._load_kyc_details()
+            results = {}
+            with ThreadPoolExecutor(max_workers=min(8, len(loaders))) as executor:
+                futures = {executor.submit(loader): name for name, loader in loaders.items()}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    results[name] = future.result()
+                    logger.debug(f"Loaded {name} data")
+            data = {name: results[name] for name in loaders}
             
-            data = {
-                'transactions': self._load_transaction_data(DATA_FILES["transactions"]),
-                'credit_card_transactions': self._load_transaction_data(DATA_FILES["credit_card_transactions"]),
-                'social_media': social_media_df,
-                'kyc': kyc_details,  # Pass KYC details directly
-                'receiver_categories': self._load_receiver_categories(),
-                'credit_cards': self._load_credit_cards_df(),
-                'loans': self._load_loans(),
-                'credit_card_list': self._load_credit_card_list(),
-                'emails': self._load_emails()
-            }
+            self._set_frames(data)
             logger.info("Successfully loaded all financial data")
             return data
         except Exception as e:
             logger.error(f"Error loading financial data: {str(e)}")
             raise
 
+    def _set_frames(self, data: Dict[str, Any]):
+        """Keep the loaded frames so the summary methods reuse them."""
+        self.transactions = data['transactions']
+        self.credit_card_transactions = data['credit_card_transactions']
+        self.social_media = data['social_media']
+        self.kyc = data['kyc']
+        self.receiver_categories = data['receiver_categories']
+        self.credit_cards = data['credit_cards']
+        self.loans = data['loans']
+        self.credit_card_list = data['credit_card_list']
+        self.emails = data['emails']
+
     def _load_credit_cards(self) -> List[Dict[str, Any]]:
         """Load credit cards data from CSV file."""
         logger.debug("Loading credit cards data")
         try:
             file_path = DATA_FILES["credit_card_list"]
-            if not file_path.exists():
-                logger.warning(f"Credit cards file not found: {file_path}")
-                return []
-                
-            df = pd.read_csv(file_path)
-            credit_cards = df.to_dict('records')
+            credit_cards = _read_records(file_path)
             logger.info(f"Loaded {len(credit_cards)} credit cards")
             return credit_cards
             
+        except FileNotFoundError:
+            logger.warning(f"Credit cards file not found: {file_path}")
+            return []
         except Exception as e:
             logger.error(f"Error loading credit cards data: {str(e)}")
             return []
@@ -81,15 +469,13 @@ class FinancialDataLoader:
         logger.debug("Loading spending data")
         try:
             file_path = DATA_FILES["transactions"]
-            if not file_path.exists():
-                logger.warning(f"Spending data file not found: {file_path}")
-                return {}
-                
-            df = pd.read_csv(file_path)
-            spending_data = df.to_dict('records')
+            spending_data = _read_records(file_path)
             logger.info("Loaded spending data successfully")
             return spending_data
             
+        except FileNotFoundError:
+            logger.warning(f"Spending data file not found: {file_path}")
+            return {}
         except Exception as e:
             logger.error(f"Error loading spending data: {str(e)}")
             return {}
@@ -99,26 +485,22 @@ class FinancialDataLoader:
         logger.debug("Loading KYC details")
         try:
             file_path = DATA_FILES["kyc"]
-            if not file_path.exists():
-                logger.warning(f"KYC details file not found: {file_path}")
-                return {}
-                
-            df = pd.read_csv(file_path)
-            # Convert the DataFrame to a dictionary, handling both single and multiple rows
+            # Only the first row is used, so stop after the first chunk;
+            # the declared schema converts the numeric columns
+            try:
+                df = next(_iter_table_chunks(file_path, KYC_SCHEMA), pd.DataFrame())
+            except pa.ArrowInvalid:
+                df = pd.read_csv(file_path, nrows=1)
+            df = _coerce_declared(df, KYC_SCHEMA)
             if len(df) > 0:
                 kyc_details = df.iloc[0].to_dict()  # Take first row if multiple exist
-                # Convert numeric columns
-                numeric_columns = ['Age', 'Income', 'Credit Score']
-                for col in numeric_columns:
-                    if col in kyc_details:
-                        try:
-                            kyc_details[col] = float(kyc_details[col])
-                        except (ValueError, TypeError):
-                            pass
                 logger.info("Loaded KYC details successfully")
                 return kyc_details
             return {}
             
+        except FileNotFoundError:
+            logger.warning(f"KYC details file not found: {file_path}")
+            return {}
         except Exception as e:
             logger.error(f"Error loading KYC details: {str(e)}")
             return {}
@@ -132,112 +514,125 @@ class FinancialDataLoader:
             else:
                 path = DATA_FILES["social_media"]
                 
-            if not path.exists():
-                logger.warning(f"Social media data file not found: {path}")
-                return []
-                
-            df = pd.read_csv(path)
-            social_data = df.to_dict('records')
+            social_data = _read_records(path)
             logger.info(f"Loaded {len(social_data)} social media posts")
             return social_data
             
+        except FileNotFoundError:
+            logger.warning(f"Social media data file not found: {path}")
+            return []
         except Exception as e:
             logger.error(f"Error loading social media data: {str(e)}")
             return []
 
+    @_cached_frame("social_media")
+    def _load_social_media_df(self) -> pd.DataFrame:
+        """Load social media posts from CSV file as a DataFrame."""
+        try:
+            return _read_table(DATA_FILES["social_media"])
+        except FileNotFoundError:
+            return pd.DataFrame()
+        except Exception as e:
+            logger.error(f"Error loading social media posts: {str(e)}")
+            return pd.DataFrame()
+
+    @_cached_frame()
     def _load_transaction_data(self, file_path: Path) -> pd.DataFrame:
         """Load transaction data from CSV file."""
         try:
-            df = pd.read_csv(file_path)
-            
-            # Convert Amount to numeric, ensuring debits are negative
-            amount_column = 'Amount (USD)' if 'Amount (USD)' in df.columns else 'Amount ($)'
-            if amount_column in df.columns:
-                df[amount_column] = pd.to_numeric(df[amount_column], errors='coerce')
-                if 'Transaction Type' in df.columns:
-                    df.loc[df['Transaction Type'].str.lower().str.contains('debit', na=False), amount_column] *= -1
-            
-            # Convert Date to datetime if it exists
-            if 'Date' in df.columns:
-                df['Date'] = pd.to_datetime(df['Date'])
-            
+            # Fix up types chunk by chunk so only one chunk is copied at a time
+            try:
+                chunks = _prepare_transaction_chunks(_iter_table_chunks(file_path, TRANSACTION_SCHEMA))
+            except pa.ArrowInvalid:
+                # Dirty amount or date cells: let pandas coerce them instead
+                logger.warning(f"Values in {file_path} do not match the declared types, coercing to NaN")
+                with pd.read_csv(file_path, chunksize=TRANSACTION_CHUNK_SIZE) as reader:
+                    chunks = _prepare_transaction_chunks(reader)
+            if not chunks:
+                return pd.DataFrame()
+            df = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+
+            # Low-cardinality text columns are stored as categories after the
+            # concat so every chunk shares one set of codes
+            for col in CATEGORICAL_COLUMNS:
+                if col in df.columns:
+                    values = df[col].astype('category')
+                    # Sorted categories whether or not Arrow dictionary-encoded the column
+                    df[col] = values.cat.reorder_categories(values.cat.categories.sort_values())
             return df
         except Exception as e:
-            print(f"{RED}Error loading transaction data from {file_path}: {str(e)}{END}")
+            logger.error(f"Error loading transaction data from {file_path}: {str(e)}")
             return pd.DataFrame()
 
+    @_cached_frame("receiver_categories")
     def _load_receiver_categories(self) -> pd.DataFrame:
         """Load receiver categories from CSV file."""
-        try:
-            return pd.read_csv(DATA_FILES["receiver_categories"])
-        except Exception as e:
-            print(f"{RED}Error loading receiver categories: {str(e)}{END}")
-            return pd.DataFrame()
+        return _read_data_file("receiver_categories", "receiver categories")
 
+    @_cached_frame("available_credit_cards")
     def _load_credit_cards_df(self) -> pd.DataFrame:
         """Load credit card details from CSV file."""
-        try:
-            df = pd.read_csv(DATA_FILES["available_credit_cards"])
-            # Convert numeric columns
-            numeric_columns = ['Annual Fee (USD)', 'Interest Rate (%)']
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-            return df
-        except Exception as e:
-            print(f"{RED}Error loading credit card details: {str(e)}{END}")
-            return pd.DataFrame()
+        return _read_data_file("available_credit_cards", "credit card details")
 
+    @_cached_frame("available_loans")
     def _load_loans(self) -> pd.DataFrame:
         """Load loan details from CSV file."""
-        try:
-            df = pd.read_csv(DATA_FILES["available_loans"])
-            # Convert numeric columns
-            numeric_columns = ['Interest Rate (%)', 'Loan Amount (USD)', 'Monthly EMI (USD)']
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-            return df
-        except Exception as e:
-            print(f"{RED}Error loading loan details: {str(e)}{END}")
-            return pd.DataFrame()
+        return _read_data_file("available_loans", "loan details")
 
+    @_cached_frame("credit_card_list")
     def _load_credit_card_list(self) -> pd.DataFrame:
         """Load credit card list from CSV file."""
-        try:
-            df = pd.read_csv(DATA_FILES["credit_card_list"])
-            # Convert numeric columns
-            if 'Credit Limit (USD)' in df.columns:
-                df['Credit Limit (USD)'] = pd.to_numeric(df['Credit Limit (USD)'], errors='coerce')
-            if 'Current Balance (USD)' in df.columns:
-                df['Current Balance (USD)'] = pd.to_numeric(df['Current Balance (USD)'], errors='coerce')
-            return df
-        except Exception as e:
-            print(f"{RED}Error loading credit card list: {str(e)}{END}")
-            return pd.DataFrame()
+        return _read_data_file("credit_card_list", "credit card list")
 
+    @_cached_frame("emails")
     def _load_emails(self) -> pd.DataFrame:
         """Load email data from CSV file."""
-        try:
-            return pd.read_csv(DATA_FILES["emails"])
-        except Exception as e:
-            print(f"{RED}Error loading email data: {str(e)}{END}")
-            return pd.DataFrame()
+        return _read_data_file("emails", "email data")
 
-    def preprocess_transactions(self) -> pd.DataFrame:
-        """Preprocess transaction data for analysis."""
+    def preprocess_transactions(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Preprocess transaction data for analysis.
+        
+        The result is cached until self.transactions is replaced, so callers
+        must not modify the returned frame in place.
+        
+        Args:
+            columns: Columns to keep; all columns are kept when omitted
+        """
         if self.transactions is None:
             raise ValueError("Transaction data not loaded")
 
-        df = self.transactions.copy()
+        if self._preprocessed_source is not self.transactions:
+            self._preprocessed = {}
+            self._preprocessed_source = self.transactions
+        key = tuple(columns) if columns is not None else None
+        if key in self._preprocessed:
+            return self._preprocessed[key]
+
+        if columns is not None:
+            # Project before filling so only the needed columns are copied
+            df = self.transactions[[col for col in columns if col in self.transactions.columns]]
+        else:
+            # No defensive copy: assign below returns a new frame
+            df = self.transactions
         
-        # Handle missing values
-        df = df.fillna({
+        # Handle missing values, filling each column once and assigning them together
+        fill_values = {
             'Amount ($)': 0,
             'Category': 'uncategorized',
             'Receiver': 'unknown'
-        })
+        }
+        filled = {}
+        for col, value in fill_values.items():
+            if col not in df.columns:
+                continue
+            values = df[col]
+            # Categorical columns only accept fill values that are known categories
+            if isinstance(values.dtype, pd.CategoricalDtype) and value not in values.cat.categories:
+                values = values.cat.add_categories([value])
+            filled[col] = values.fillna(value)
+        df = df.assign(**filled)
 
+        self._preprocessed[key] = df
         return df
 
     def get_spending_categories(self) -> Dict[str, float]:
@@ -245,35 +640,60 @@ class FinancialDataLoader:
         if self.transactions is None:
             raise ValueError("Transaction data not loaded")
 
-        df = self.preprocess_transactions()
-        return df.groupby('Category')['Amount ($)'].sum().to_dict()
+        df = self.preprocess_transactions(['Category', 'Amount ($)'])
+        return df.groupby('Category', observed=True)['Amount ($)'].sum().to_dict()
 
     def get_monthly_summary(self) -> pd.DataFrame:
         """Generate monthly summary of transactions."""
         if self.transactions is None:
             raise ValueError("Transaction data not loaded")
 
-        df = self.preprocess_transactions()
-        df['month'] = df['Date'].dt.to_period('M')
-        return df.groupby('month').agg({
-            'Amount ($)': ['sum', 'mean', 'count'],
-            'Category': lambda x: x.value_counts().index[0]  # Most common category
-        }).round(2)
+        df = self.preprocess_transactions(['Date', 'Category', 'Amount ($)'])
+        # Bucket by month as datetime64[M] and encode the months once for
+        # every aggregate below
+        month_codes, months = pd.factorize(df['Date'].to_numpy().astype('datetime64[M]'))
+        months = pd.Index(months, name='month')
+        
+        # Sum, count and mean of the non-missing amounts per month
+        amounts = df['Amount ($)'].to_numpy(dtype=np.float64)
+        valid = (month_codes >= 0) & ~np.isnan(amounts)
+        sums = np.bincount(month_codes[valid], weights=amounts[valid], minlength=len(months))
+        amount_counts = np.bincount(month_codes[valid], minlength=len(months))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / amount_counts
+        summary = pd.DataFrame({
+            ('Amount ($)', 'sum'): sums,
+            ('Amount ($)', 'mean'): means,
+            ('Amount ($)', 'count'): amount_counts
+        }, index=months)
+        
+        # Most common category per month from a single (month, category) count matrix
+        category_codes, categories = pd.factorize(df['Category'])
+        if len(months) == 0 or len(categories) == 0:
+            # Nothing to summarize; return no rows under the same columns
+            summary = summary.iloc[:0]
+            summary[('Category', 'mode')] = pd.Series(dtype=object)
+        else:
+            valid = (month_codes >= 0) & (category_codes >= 0)
+            counts = np.bincount(
+                month_codes[valid] * len(categories) + category_codes[valid],
+                minlength=len(months) * len(categories)
+            ).reshape(len(months), len(categories))
+            summary[('Category', 'mode')] = categories.take(counts.argmax(axis=1))
+        
+        summary = summary.round(2).sort_index()
+        summary.index = summary.index.to_period('M')
+        return summary
 
     def get_credit_card_usage(self) -> pd.DataFrame:
         """Analyze credit card usage patterns."""
         if self.credit_card_transactions is None or self.credit_card_list is None:
             raise ValueError("Credit card data not loaded")
 
-        transactions = self.credit_card_transactions.copy()
-        cards = self.credit_card_list.copy()
-
-        # Merge transaction data with card information
-        merged_data = pd.merge(transactions, cards, on='Card ID', how='left')
-        
-        # Convert dates
-        merged_data['Date'] = pd.to_datetime(merged_data['Date'])
-        merged_data['Issued Date'] = pd.to_datetime(merged_data['Issued Date'])
-        merged_data['Expiry Date'] = pd.to_datetime(merged_data['Expiry Date'])
-
-        return merged_data 
\ No newline at end of file
+        # Join transaction data with card information, probing the small
+        # card table by its index; join returns a new frame so no copies needed
+        # Date, Issued Date and Expiry Date are already parsed by the loaders
+        cards = self.credit_card_list.set_index('Card ID')
+        return self.credit_card_transactions.join(
+            cards, on='Card ID', how='left', lsuffix='_x', rsuffix='_y', sort=False
+        ) 
\ No newline at end of file
@@ -1,9 +1,9 @@
 from src.data_processing.data_loader import FinancialDataLoader
 from src.data_processing.data_extractor import DataExtractor
 from src.recommendation.product_recommender import ProductRecommender
-import json
 import logging
 from src.utils.logger import setup_logger
+from src.utils.json_io import dump_json, write_json
 
 # ANSI color codes
 BLUE = "\033[94m"
@@ -18,8 +18,7 @@ logger = setup_logger(__name__)
 def save_json(data, filename):
     """Save data to a JSON file."""
     try:
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json(data, filename)
         print(f"✓ Saved {filename}")
     except Exception as e:
         print(f"Error saving {filename}: {e}")
@@ -69,9 +68,9 @@ def main():
         
         print("\n=== Final Recommendations ===\n")
         print("Product Recommendations:")
-        print(json.dumps(product_recommendations, indent=2))
+        print(dump_json(product_recommendations).decode())
         print("\nCredit Card Recommendations:")
-        print(json.dumps(credit_card_recommendations, indent=2))
+        print(dump_json(credit_card_recommendations).decode())
         
     except Exception as e:
         logger.error(f"Error in main: {str(e)}")
@@ -0,0 +1,34 @@
+import pandas as pd
+from datetime import datetime
+
+# Date formats found in the data files, tried in order
+DATE_FORMATS = ['%Y-%m-%d', '%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y']
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Convert a column to datetimes using a single known format.
+    
+    The format is picked once by probing the first non-null value, so pandas
+    can take its vectorized parsing path instead of inferring per cell.
+    Unparseable values become NaT.
+    
+    Args:
+        values: Column of date strings or datetimes
+        
+    Returns:
+        Column converted to datetime64
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    
+    first_valid = values.first_valid_index()
+    if first_valid is not None:
+        sample = str(values[first_valid])
+        for date_format in DATE_FORMATS:
+            try:
+                datetime.strptime(sample, date_format)
+            except ValueError:
+                continue
+            return pd.to_datetime(values, format=date_format, cache=True, errors='coerce')
+    return pd.to_datetime(values, cache=True, errors='coerce')
@@ -0,0 +1,44 @@
+import orjson
+from pathlib import Path
+from typing import Any, Union
+
+# Indented output that also accepts numpy values from pandas and non-string
+# keys, which json.dumps converted to strings
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def dump_json(data: Any) -> bytes:
+    """
+    Serialize data to indented JSON.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(data, option=JSON_OPTIONS)
+
+
+def write_json(data: Any, path: Union[str, Path]) -> None:
+    """
+    Write data to a JSON file.
+    
+    Args:
+        data: Data to serialize
+        path: Path of the file to write
+    """
+    Path(path).write_bytes(dump_json(data))
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Read a JSON file, parsing the raw bytes without decoding them to str first.
+    
+    Args:
+        path: Path of the file to read
+        
+    Returns:
+        Parsed JSON data
+    """
+    return orjson.loads(Path(path).read_bytes())
@@ -1,13 +1,35 @@
+import functools
 import logging
 import sys
 from pathlib import Path
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 
+class ColorFormatter(logging.Formatter):
+    """Formatter that colors console messages by level."""
+    
+    # ANSI color codes
+    LEVEL_COLORS = {
+        logging.DEBUG: "\033[94m",
+        logging.INFO: "\033[92m",
+        logging.WARNING: "\033[93m",
+        logging.ERROR: "\033[91m",
+        logging.CRITICAL: "\033[91m",
+    }
+    END = "\033[0m"
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        color = self.LEVEL_COLORS.get(record.levelno)
+        return f"{color}{message}{self.END}" if color else message
+
+@functools.lru_cache(maxsize=None)
 def setup_logger(name: str) -> logging.Logger:
     """
     Set up a logger with both file and console handlers.
     
+    Results are memoized per name so repeated calls never attach duplicate handlers.
+    
     Args:
         name: The name of the logger (usually __name__ from the calling module)
         
@@ -26,7 +48,9 @@ def setup_logger(name: str) -> logging.Logger:
     file_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    console_formatter = logging.Formatter(
+    # Only color the console output when it is a terminal
+    console_formatter_class = ColorFormatter if sys.stdout.isatty() else logging.Formatter
+    console_formatter = console_formatter_class(
         '%(asctime)s - %(levelname)s - %(message)s'
     )
     
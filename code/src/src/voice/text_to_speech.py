@@ -1,20 +1,39 @@
-from gtts import gTTS
+import hashlib
+import os
+import shutil
+import threading
+import wave
 from pathlib import Path
-from typing import Optional
+from typing import Generator, Iterable, Optional
+from piper import PiperVoice
 from src.utils.logger import setup_logger
+from config.config import TTS_MODEL_PATH, TTS_SETTINGS
 
 # Set up logging
 logger = setup_logger(__name__)
 
 class TextToSpeech:
-    """Text-to-speech module using Google Text-to-Speech."""
+    """Text-to-speech module using a local Piper voice."""
     
     def __init__(self):
         """Initialize the text-to-speech converter."""
         logger.info("Initializing TextToSpeech")
         self.output_dir = Path("output/audio")
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug("Output directory created")
+        # Synthesized clips are cached per voice, keyed by a hash of the text
+        self.cache_dir = self.output_dir / "cache" / TTS_MODEL_PATH.stem
+        
+        # Synthesis runs locally on ONNX Runtime, so there is no network round trip per call
+        self.voice = PiperVoice.load(str(TTS_MODEL_PATH))
+        logger.debug(f"Loaded Piper voice from {TTS_MODEL_PATH}")
+    
+    def warmup(self) -> None:
+        """Synthesize a short phrase so the first real request skips ONNX Runtime setup costs."""
+        logger.debug("Warming up Piper voice")
+        try:
+            for _ in self.voice.synthesize("Hello."):
+                pass
+        except Exception as e:
+            logger.warning(f"Piper warmup failed: {str(e)}")
     
     def text_to_speech(self, text: str, output_file: str) -> Optional[str]:
         """
@@ -22,24 +41,136 @@ class TextToSpeech:
         
         Args:
             text: Text to convert to speech
-            output_file: Path to save the audio file
+            output_file: Path to save the WAV audio file
             
         Returns:
             Path to the saved audio file or None if conversion fails
         """
-        logger.info(f"Converting text to speech: {text[:100]}...")
+        logger.info("Converting text to speech: %.100s...", text)
         try:
-            # Create gTTS object
-            logger.debug("Creating gTTS object")
-            tts = gTTS(text=text, lang='en', slow=False)
+            key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+            cache_path = self.cache_dir / f"{key}.wav"
+            if cache_path.exists():
+                logger.debug(f"Reusing cached audio {cache_path}")
+                # Mark the entry as recently used so pruning evicts it last
+                os.utime(cache_path)
+                synthesized = False
+            else:
+                logger.debug(f"Synthesizing audio into {cache_path}")
+                # Created on every miss rather than once, since the cache may be deleted while running
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                # Synthesize into a temporary file so a failed run never leaves a partial cache entry
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                try:
+                    with wave.open(str(tmp_path), 'wb') as wav_file:
+                        self.voice.synthesize_wav(text, wav_file)
+                    os.replace(tmp_path, cache_path)
+                except BaseException:
+                    # prune_cache only sees finished clips, so leftovers would never be evicted
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+                synthesized = True
             
-            # Save audio file
+            # Replace rather than overwrite, since an existing output may be a link to another cache entry;
+            # hardlink when possible and copy across filesystems
             logger.debug(f"Saving audio file to {output_file}")
-            tts.save(output_file)
+            Path(output_file).unlink(missing_ok=True)
+            try:
+                os.link(cache_path, output_file)
+            except OSError:
+                shutil.copyfile(cache_path, output_file)
             logger.info(f"Audio file saved successfully: {output_file}")
             
+            # Only new entries grow the cache; pruned after saving so the new clip is never evicted unused
+            if synthesized:
+                self.prune_cache()
+            
             return output_file
             
         except Exception as e:
             logger.error(f"Error converting text to speech: {str(e)}")
-            return None 
\ No newline at end of file
+            return None
+
+    def prune_cache(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Evict the least recently used cached clips until the cache fits in max_bytes.
+        
+        Response files already saved are hardlinks or copies, so they stay intact.
+        
+        Args:
+            max_bytes: Size limit for this voice's cache; TTS_SETTINGS["cache_max_bytes"] when omitted
+            
+        Returns:
+            Number of clips removed
+        """
+        if max_bytes is None:
+            max_bytes = TTS_SETTINGS["cache_max_bytes"]
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                clips = [(entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                         for entry in entries if entry.name.endswith(".wav")]
+            total = sum(size for _, size, _ in clips)
+            removed = 0
+            # Oldest first; cache hits refresh the modification time
+            for _, size, path in sorted(clips):
+                if total <= max_bytes:
+                    break
+                Path(path).unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            if removed:
+                logger.debug(f"Evicted {removed} clips from {self.cache_dir}")
+            return removed
+            
+        except Exception as e:
+            logger.error(f"Error pruning speech cache: {str(e)}")
+            return 0
+    
+    def text_to_speech_stream(self, sentences: Iterable[str], output_file: str) -> Generator[str, None, Optional[str]]:
+        """
+        Convert sentences to speech as they arrive, appending them to one audio file.
+        
+        Errors raised while producing the sentences propagate to the caller, which
+        should discard the partly written file.
+        
+        Args:
+            sentences: Text to convert, one sentence at a time
+            output_file: Path to save the WAV audio file
+            
+        Yields:
+            Each sentence once its audio has been written
+            
+        Returns:
+            Path to the saved audio file, or None if there was no text or synthesis fails
+        """
+        logger.info(f"Streaming speech to {output_file}")
+        Path(output_file).unlink(missing_ok=True)
+        wav_file = None
+        try:
+            for sentence in sentences:
+                try:
+                    # Opened on the first sentence so an empty response leaves no file behind
+                    if wav_file is None:
+                        wav_file = wave.open(str(output_file), 'wb')
+                        # Piper voices produce 16-bit mono audio; set the header once so each sentence only adds frames
+                        wav_file.setnchannels(1)
+                        wav_file.setsampwidth(2)
+                        wav_file.setframerate(self.voice.config.sample_rate)
+                    self.voice.synthesize_wav(sentence, wav_file, set_wav_format=False)
+                except Exception as e:
+                    logger.error(f"Error streaming text to speech: {str(e)}")
+                    if wav_file is not None:
+                        wav_file.close()
+                        wav_file = None
+                    Path(output_file).unlink(missing_ok=True)
+                    return None
+                yield sentence
+        finally:
+            if wav_file is not None:
+                wav_file.close()
+        
+        if wav_file is None:
+            logger.warning(f"No text to convert, nothing written to {output_file}")
+            return None
+        logger.info(f"Audio file saved successfully: {output_file}")
+        return output_file
@@ -1,63 +1,212 @@
-from typing import Optional, Tuple, Dict, List, Any
+from typing import Optional, Tuple, Dict, List, Any, Callable, Iterable, Iterator
 from .audio_transcriber import AudioTranscriber
 from .text_to_speech import TextToSpeech
 from src.ai.llm_interaction import LLMInteraction
-import json
+import asyncio
+import copy
+import functools
+import orjson
+import mmap
 import os
+import re
+import threading
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from termcolor import colored
 from src.utils.logger import setup_logger
 
 # Set up logging
 logger = setup_logger(__name__)
 
+def _log_errors(message: str, default: Any = None) -> Callable:
+    """Decorate a method to log any exception it raises and return a copy of default instead.
+    
+    Args:
+        message: Prefix for the logged error
+        default: Value returned when the method fails
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{message}: {str(e)}")
+                return copy.copy(default)
+        return wrapper
+    return decorator
+
+# Components shared by every processor in the process, since each one holds model weights
+_COMPONENTS: Dict[Tuple, Any] = {}
+_COMPONENTS_LOCK = threading.Lock()
+
+def _shared_component(key: Tuple, factory: Callable[[], Any]) -> Any:
+    """Return the process-wide component for key, creating it on first use."""
+    component = _COMPONENTS.get(key)
+    if component is None:
+        with _COMPONENTS_LOCK:
+            component = _COMPONENTS.get(key)
+            if component is None:
+                component = _COMPONENTS[key] = factory()
+    return component
+
+# llama.cpp contexts are not thread-safe; every generation on the shared model holds this
+_LLM_LOCK = threading.Lock()
+
+# JSON files at least this large are memory-mapped rather than read; smaller ones are cheaper to read whole
+MMAP_MIN_SIZE = 1024 * 1024
+
+# End of a sentence in streamed response text
+SENTENCE_END = re.compile(r'[.!?]\s')
+
+def _split_sentences(chunks: Iterable[str]) -> Iterator[str]:
+    """Regroup streamed text chunks into whole sentences."""
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        while (match := SENTENCE_END.search(buffer)):
+            sentence, buffer = buffer[:match.end()].strip(), buffer[match.end():]
+            if sentence:
+                yield sentence
+    if buffer.strip():
+        yield buffer.strip()
+
 class VoiceProcessor:
     """Voice processing module for handling audio input and output."""
     
-    def __init__(self):
-        """Initialize the voice processor with necessary components."""
+    # Analysis outputs written by main.py that responses are based on
+    RECOMMENDATION_FILES = (
+        "spending_analysis.json",
+        "kyc_details.json",
+        "user_interests.json",
+        "product_recommendations.json",
+        "credit_card_recommendations.json"
+    )
+    
+    # Subset of the outputs used to answer audio queries, keyed by the name they are passed under
+    USER_DATA_FILES = {
+        'spending_data': "spending_analysis.json",
+        'kyc_details': "kyc_details.json",
+        'credit_card_recommendations': "credit_card_recommendations.json"
+    }
+    
+    def __init__(self, compute_type: Optional[str] = None, warmup: bool = False):
+        """Initialize the voice processor with necessary components.
+        
+        Args:
+            compute_type: CTranslate2 compute type for the Whisper model, e.g. "int8";
+                picked for the device when omitted. Only AudioTranscriber.transcribe uses
+                Whisper; the processing methods here transcribe with Google speech recognition
+            warmup: Run the LLM and speech models once on dummy input so the first request is not slowed down
+        """
         logger.info("Initializing Voice Processor...")
         
-        # Initialize components
-        self.transcriber = AudioTranscriber()
-        self.tts = TextToSpeech()
-        self.llm = LLMInteraction()
+        # Initialize components, reusing any already loaded in this process
+        self.transcriber = _shared_component(("transcriber", compute_type), lambda: AudioTranscriber(compute_type))
+        self.tts = _shared_component(("tts",), TextToSpeech)
+        self.llm = _shared_component(("llm",), LLMInteraction)
         
         # Set up directories
         self.audio_dir = Path("audio")
         self.output_dir = Path("output")
+        self._audio_out_dir = self.output_dir / "audio"
+        self._audio_out_dir.mkdir(parents=True, exist_ok=True)
+        # Response file path with the input file's stem left as a placeholder
+        self._out_fmt = str(self._audio_out_dir / "response_{stem}.wav")
+        
+        # Parsed JSON outputs keyed by path, with the mtime they were read at
+        self._json_cache: Dict[Path, Tuple[int, Any]] = {}
+        # Worker threads for file reads, which release the GIL
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+        
+        # Parse the outputs up front so the first request only has to stat them
+        self.reload()
+        
+        if warmup:
+            self.warmup()
         
         logger.debug("Voice Processor components initialized")
         logger.info("Voice Processor initialized successfully!")
 
+    def warmup(self) -> None:
+        """Run the LLM and speech models once on dummy input.
+        
+        Transcription goes through Google speech recognition, so there is no local model to warm up.
+        """
+        logger.info("Warming up voice models...")
+        with _LLM_LOCK:
+            self.llm.warmup()
+        self.tts.warmup()
+        logger.info("Voice models warmed up")
+
+    def _load_json_cached(self, path: Path) -> Any:
+        """Load a JSON file, reusing the parsed result while the file is unchanged.
+        
+        Args:
+            path: Path to the JSON file
+            
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        stat = path.stat()
+        mtime = stat.st_mtime_ns
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        if stat.st_size >= MMAP_MIN_SIZE:
+            # Parse straight from the page cache instead of copying the file into a bytes object
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    data = orjson.loads(view)
+        else:
+            data = orjson.loads(path.read_bytes())
+        self._json_cache[path] = (mtime, data)
+        return data
+
+    @_log_errors("Error loading recommendation data", {})
     def load_recommendation_data(self) -> Dict:
         """Load recommendation data from output directory.
         
         Returns:
             Dictionary containing recommendation data
         """
+        data = {}
+        
+        # List the directory once so reads are only queued for files that exist
         try:
-            data = {}
-            output_files = [
-                "spending_analysis.json",
-                "kyc_details.json",
-                "user_interests.json",
-                "product_recommendations.json",
-                "credit_card_recommendations.json"
-            ]
-            
-            for file in output_files:
-                file_path = self.output_dir / file
-                if file_path.exists():
-                    with open(file_path, 'r') as f:
-                        data[file.replace('.json', '')] = json.load(f)
-            
+            with os.scandir(self.output_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
             return data
-            
-        except Exception as e:
-            logger.error(f"Error loading recommendation data: {str(e)}")
-            return {}
+        
+        # Read all files concurrently, then collect them in order
+        futures = {
+            file.replace('.json', ''): self._io_pool.submit(self._load_json_cached, self.output_dir / file)
+            for file in self.RECOMMENDATION_FILES
+            if file in present
+        }
+        for name, future in futures.items():
+            try:
+                data[name] = future.result()
+            except FileNotFoundError:
+                continue
+        
+        return data
+
+    def reload(self) -> Dict:
+        """Discard the cached outputs and read them again from disk.
+        
+        Cached data is already refreshed when a file's modification time changes;
+        this also covers files replaced without a new timestamp.
+        
+        Returns:
+            Dictionary containing recommendation data
+        """
+        logger.debug("Reloading recommendation data")
+        self._json_cache.clear()
+        return self.load_recommendation_data()
 
+    @_log_errors("Error processing query", "")
     def process_query(self, query: str) -> str:
         """Process a text query and generate a response.
         
@@ -67,24 +216,20 @@ class VoiceProcessor:
         Returns:
             Generated response text
         """
-        try:
-            # Load data from output directory
-            data = self.load_recommendation_data()
-            
-            # Generate response using LLM
-            response = self.llm.generate_response(query, data)
-            
-            if not response:
-                logger.error("Failed to generate response.")
-                return ""
-                
-            logger.info(f"Generated response: {response[:100]}...")
-            return response
-            
-        except Exception as e:
-            logger.error(f"Error processing query: {str(e)}")
+        # Load data from output directory
+        data = self.load_recommendation_data()
+        
+        # Generate response using LLM
+        response = self._generate_response_locked(query, data)
+        
+        if not response:
+            logger.error("Failed to generate response.")
             return ""
+            
+        logger.info("Generated response: %.100s...", response)
+        return response
 
+    @_log_errors("Error processing audio file", None)
     def process_audio_file(self, audio_file: str) -> Optional[str]:
         """
         Process an audio file: transcribe, generate response, and convert to speech.
@@ -96,34 +241,79 @@ class VoiceProcessor:
             Generated response text or None if processing fails
         """
         logger.info(f"Starting processing of audio file: {audio_file}")
+        # Start reading user data so the file I/O overlaps with transcription
+        pending_data = self._start_user_data_load()
+        
+        # Transcribe audio to text
+        logger.debug("Transcribing audio to text")
+        transcribed_text = self.transcriber.transcribe_audio(audio_file)
+        if not transcribed_text:
+            logger.error("Transcription failed")
+            return None
+        logger.info("Transcribed text: %.100s...", transcribed_text)
+        
+        # Load user data
+        logger.debug("Loading user data")
+        data = self._load_user_data(pending_data)
+        if not data:
+            logger.error("Failed to load user data")
+            return None
+            
+        # Generate response using LLM
+        logger.debug("Generating response using LLM")
+        response = self._generate_response_locked(transcribed_text, data)
+        if not response:
+            logger.error("Failed to generate response")
+            return None
+        logger.info("Generated response: %.100s...", response)
+        
+        # Convert response to speech
+        logger.debug("Converting response to speech")
+        output_file = self._get_output_file(audio_file)
+        self.tts.text_to_speech(response, output_file)
+        logger.info(f"Response saved as audio: {output_file}")
+        
+        return response
+
+    async def process_audio_file_async(self, audio_file: str) -> Optional[str]:
+        """
+        Process an audio file like process_audio_file without blocking the event loop.
+        
+        Transcription, generation and speech synthesis run on worker threads, so an
+        async server can keep handling other requests while one is processed.
+        
+        Args:
+            audio_file: Path to the audio file
+            
+        Returns:
+            Generated response text or None if processing fails
+        """
+        logger.info(f"Starting async processing of audio file: {audio_file}")
+        loop = asyncio.get_running_loop()
         try:
-            # Transcribe audio to text
-            logger.debug("Transcribing audio to text")
-            transcribed_text = self.transcriber.transcribe_audio(audio_file)
+            # User data is read on the I/O pool while the audio is transcribed
+            pending_data = self._start_user_data_load()
+            transcribed_text = await loop.run_in_executor(None, self.transcriber.transcribe_audio, audio_file)
             if not transcribed_text:
                 logger.error("Transcription failed")
                 return None
-            logger.info(f"Transcribed text: {transcribed_text[:100]}...")
+            logger.info("Transcribed text: %.100s...", transcribed_text)
             
-            # Load user data
-            logger.debug("Loading user data")
-            data = self._load_user_data()
+            data = await loop.run_in_executor(None, self._load_user_data, pending_data)
             if not data:
                 logger.error("Failed to load user data")
                 return None
-                
+            
             # Generate response using LLM
-            logger.debug("Generating response using LLM")
-            response = self.llm.generate_response(transcribed_text, data)
+            response = await loop.run_in_executor(None, self._generate_response_locked, transcribed_text, data)
             if not response:
                 logger.error("Failed to generate response")
                 return None
-            logger.info(f"Generated response: {response[:100]}...")
+            logger.info("Generated response: %.100s...", response)
             
             # Convert response to speech
-            logger.debug("Converting response to speech")
             output_file = self._get_output_file(audio_file)
-            self.tts.text_to_speech(response, output_file)
+            await loop.run_in_executor(None, self.tts.text_to_speech, response, output_file)
             logger.info(f"Response saved as audio: {output_file}")
             
             return response
@@ -132,53 +322,143 @@ class VoiceProcessor:
             logger.error(f"Error processing audio file: {str(e)}")
             return None
 
-    def _load_user_data(self) -> Optional[Dict[str, Any]]:
-        """Load user data from JSON files."""
-        logger.debug("Loading user data from JSON files")
+    def _generate_response_locked(self, query: str, data: Dict[str, Any]) -> str:
+        """Generate a response while holding the shared LLM lock."""
+        with _LLM_LOCK:
+            return self.llm.generate_response(query, data)
+
+    def _generate_response_stream_locked(self, query: str, data: Dict[str, Any]) -> Iterator[str]:
+        """Stream a response, holding the shared LLM lock until the stream is exhausted or closed."""
+        with _LLM_LOCK:
+            yield from self.llm.generate_response_stream(query, data)
+
+    def process_audio_file_stream(self, audio_file: str) -> Iterator[str]:
+        """
+        Process an audio file like process_audio_file, speaking the response while it is generated.
+        
+        The LLM response is streamed and converted to speech one sentence at a time,
+        so audio is written before the full response exists.
+        
+        Args:
+            audio_file: Path to the audio file
+            
+        Yields:
+            Each response sentence once its audio has been written to the output file
+        """
+        logger.info(f"Starting streamed processing of audio file: {audio_file}")
+        output_file = None
         try:
-            output_dir = Path("output")
-            
-            # Load spending data
-            spending_path = output_dir / "spending_analysis.json"
-            logger.debug(f"Loading spending data from {spending_path}")
-            with open(spending_path, 'r') as f:
-                spending_data = json.load(f)
-                
-            # Load KYC details
-            kyc_path = output_dir / "kyc_details.json"
-            logger.debug(f"Loading KYC details from {kyc_path}")
-            with open(kyc_path, 'r') as f:
-                kyc_details = json.load(f)
-                
-            # Load credit card recommendations
-            credit_path = output_dir / "credit_card_recommendations.json"
-            logger.debug(f"Loading credit card recommendations from {credit_path}")
-            with open(credit_path, 'r') as f:
-                credit_recommendations = json.load(f)
-                
-            logger.info("Successfully loaded all user data")
-            return {
-                'spending_data': spending_data,
-                'kyc_details': kyc_details,
-                'credit_card_recommendations': credit_recommendations
-            }
+            pending_data = self._start_user_data_load()
             
-        except Exception as e:
-            logger.error(f"Error loading user data: {str(e)}")
-            return None
+            # Transcribe audio to text
+            transcribed_text = self.transcriber.transcribe_audio(audio_file)
+            if not transcribed_text:
+                logger.error("Transcription failed")
+                return
+            logger.info("Transcribed text: %.100s...", transcribed_text)
             
-    def _get_output_file(self, input_file: str) -> str:
-        """Generate output file path for the audio response."""
-        logger.debug("Generating output file path")
-        try:
-            input_path = Path(input_file)
-            output_dir = Path("output/audio")
-            output_dir.mkdir(parents=True, exist_ok=True)
+            data = self._load_user_data(pending_data)
+            if not data:
+                logger.error("Failed to load user data")
+                return
             
-            output_file = output_dir / f"response_{input_path.stem}.mp3"
-            logger.debug(f"Output file path: {output_file}")
-            return str(output_file)
+            # Speak each sentence as soon as the LLM has finished it
+            output_file = self._get_output_file(audio_file)
+            chunks = self._generate_response_stream_locked(transcribed_text, data)
+            if not (yield from self.tts.text_to_speech_stream(_split_sentences(chunks), output_file)):
+                logger.error("Failed to convert response to speech")
+                return
+            logger.info(f"Response saved as audio: {output_file}")
             
         except Exception as e:
-            logger.error(f"Error generating output file path: {str(e)}")
-            return "output/audio/response.mp3" 
\ No newline at end of file
+            logger.error(f"Error processing audio file: {str(e)}")
+            # Drop the audio of the sentences spoken before the failure
+            if output_file is not None:
+                Path(output_file).unlink(missing_ok=True)
+
+    def process_audio_files(self, audio_files: List[str]) -> List[Optional[str]]:
+        """
+        Process several audio files, sharing the user data and overlapping their I/O.
+        
+        Transcriptions run concurrently on the I/O pool, responses are generated one
+        at a time on the shared LLM, and each response is converted to speech in the
+        background while the next one is generated.
+        
+        Args:
+            audio_files: Paths to the audio files
+            
+        Returns:
+            Generated response text per file in input order, None where processing fails
+        """
+        logger.info(f"Starting processing of {len(audio_files)} audio files")
+        pending_data = self._start_user_data_load()
+        transcriptions = [self._io_pool.submit(self.transcriber.transcribe_audio, audio_file) for audio_file in audio_files]
+        
+        # User data is loaded once for the whole batch
+        data = self._load_user_data(pending_data)
+        if not data:
+            logger.error("Failed to load user data")
+            return [None] * len(audio_files)
+        
+        responses = []
+        speech_jobs = []
+        for audio_file, transcription in zip(audio_files, transcriptions):
+            response = None
+            try:
+                transcribed_text = transcription.result()
+                if not transcribed_text:
+                    logger.error(f"Transcription failed: {audio_file}")
+                else:
+                    response = self._generate_response_locked(transcribed_text, data)
+                    if not response:
+                        logger.error(f"Failed to generate response: {audio_file}")
+                        response = None
+                    else:
+                        output_file = self._get_output_file(audio_file)
+                        speech_jobs.append(self._io_pool.submit(self.tts.text_to_speech, response, output_file))
+            except Exception as e:
+                logger.error(f"Error processing audio file {audio_file}: {str(e)}")
+                response = None
+            responses.append(response)
+        
+        # Wait for the remaining speech output before returning
+        for job in speech_jobs:
+            job.result()
+        logger.info(f"Processed {sum(r is not None for r in responses)} of {len(audio_files)} audio files")
+        return responses
+
+    def _start_user_data_load(self) -> Dict[str, Future]:
+        """Submit the user data reads to the I/O pool without waiting for them.
+        
+        Reads share the JSON cache with load_recommendation_data, so files
+        already loaded there are served from memory.
+        """
+        pending = {}
+        for name, file in self.USER_DATA_FILES.items():
+            path = self.output_dir / file
+            logger.debug(f"Loading {name} from {path}")
+            pending[name] = self._io_pool.submit(self._load_json_cached, path)
+        return pending
+
+    @_log_errors("Error loading user data", None)
+    def _load_user_data(self, pending: Optional[Dict[str, Future]] = None) -> Optional[Dict[str, Any]]:
+        """Load user data from JSON files.
+        
+        Args:
+            pending: Reads already started by _start_user_data_load; started here if omitted
+        """
+        logger.debug("Loading user data from JSON files")
+        if pending is None:
+            pending = self._start_user_data_load()
+        
+        # The reads run concurrently; a failed read re-raises here
+        data = {name: future.result() for name, future in pending.items()}
+            
+        logger.info("Successfully loaded all user data")
+        return data
+            
+    def _get_output_file(self, input_file: str) -> str:
+        """Generate output file path for the audio response."""
+        output_file = self._out_fmt.format(stem=os.path.splitext(os.path.basename(input_file))[0])
+        logger.debug(f"Output file path: {output_file}")
+        return output_file